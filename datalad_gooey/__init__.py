@@ -24,6 +24,7 @@ command_suite = (
 from datalad.support.extensions import register_config
 from datalad.support.constraints import (
     EnsureChoice,
+    EnsureInt,
     EnsureStr,
 )
 register_config(
@@ -51,6 +52,17 @@ register_config(
     type=EnsureChoice('system', 'light', 'dark'),
     default='system',
     scope='global')
+register_config(
+    'datalad.gooey.log-max-blocks',
+    'Maximum number of text blocks kept in the command and error logs',
+    description=\
+    "Once the limit is reached, the oldest blocks (typically lines) are "
+    "removed from a log, whenever new content is added. This bounds the "
+    "memory demand and rendering cost of the logs in long sessions. "
+    "A value of zero lifts the limit.",
+    type=EnsureInt(),
+    default=10000,
+    scope='global')
 
 
 from ._version import get_versions
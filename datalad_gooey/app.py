@@ -2,29 +2,29 @@ import logging
 import sys
 from types import MappingProxyType
 from os import environ
-from outdated import check_outdated
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication,
     QMenu,
     QPlainTextEdit,
-    QPushButton,
     QStatusBar,
     QTabWidget,
     QTreeWidget,
     QWidget,
     QMessageBox,
     QFileDialog,
+    QMainWindow,
 )
 from PySide6.QtCore import (
     QObject,
     Qt,
+    QThreadPool,
+    QTimer,
     Signal,
     Slot,
 )
 from PySide6.QtGui import (
     QAction,
-    QCursor,
     QGuiApplication,
 )
 
@@ -32,6 +32,7 @@ from datalad import cfg as dlcfg
 from datalad import __version__ as dlversion
 import datalad.ui as dlui
 from datalad.interface.base import Interface
+from datalad.support.exceptions import CapturedException
 from datalad.local.wtf import (
     _render_report,
     WTF,
@@ -39,9 +40,11 @@ from datalad.local.wtf import (
 from datalad.utils import chpwd
 
 from .utils import (
-    load_ui,
+    cached_property,
     render_cmd_call,
+    setup_ui,
 )
+from ._ui_main_window import Ui_MainWindow
 from .datalad_ui import GooeyUI
 from .dataladcmd_exec import GooeyDataladCmdExec
 from .dataladcmd_ui import GooeyDataladCmdUI
@@ -75,8 +78,13 @@ class GooeyApp(QObject):
         'actionDiagnostic_infos': QAction,
     }
 
+    # MappingProxyType is not a type PySide converts. Arguments are passed
+    # on as-is, which is cheaper than the QVariantMap conversion that
+    # declaring `dict` would trigger at every emission
     execute_dataladcmd = Signal(str, MappingProxyType, MappingProxyType)
     configure_dataladcmd = Signal(str, MappingProxyType)
+    # is_outdated (None if undetermined), latest version
+    version_checked = Signal(object, str)
 
     def __init__(self, path: Path = None):
         super().__init__()
@@ -102,12 +110,27 @@ class GooeyApp(QObject):
         environ['SSH_ASKPASS_REQUIRE'] = 'force'
         environ['SSH_ASKPASS'] = 'datalad-gooey-askpass'
 
+        # on macOS, AppNap gets disabled while commands are running, to
+        # prevent the event loop from being throttled while the app is in
+        # the background. See _set_appnap()
+        self._appnope = None
+        self._appnap_disabled = False
+        if sys.platform == 'darwin':
+            try:
+                import appnope
+                self._appnope = appnope
+            except ImportError:
+                lgr.debug('Not disabling AppNap, no `appnope` installation')
+
         # setup themeing before the first dialog goes up
         self._setup_looknfeel()
 
         self._dlapi = None
-        self._main_window = None
         self._cmdexec = GooeyDataladCmdExec()
+        # bound the size of the logs, they would grow indefinitely otherwise
+        log_max_blocks = dlcfg.obtain('datalad.gooey.log-max-blocks')
+        for log in ('commandLog', 'errorLog'):
+            self.get_widget(log).setMaximumBlockCount(log_max_blocks)
         self._cmdui = GooeyDataladCmdUI(self, self.get_widget('cmdTab'))
 
         # setup UI
@@ -141,10 +164,6 @@ class GooeyApp(QObject):
         self._cmdexec.execution_started.connect(self._setup_ongoing_cmdexec)
         self._cmdexec.execution_finished.connect(self._setup_stopped_cmdexec)
         self._cmdexec.execution_failed.connect(self._setup_stopped_cmdexec)
-        # arrange for the dataset menu to populate itself lazily once
-        # necessary
-        self.get_widget('menuDatalad').aboutToShow.connect(
-            self._populate_datalad_menu)
         self.main_window.actionSetBaseDirectory.triggered.connect(
             self._set_root_path)
         self.main_window.actionCheck_for_new_version.triggered.connect(
@@ -160,6 +179,8 @@ class GooeyApp(QObject):
         # connect the diagnostic WTF helper
         self._cmdexec.results_received.connect(
             self._app_cmdexec_results_handler)
+        # report the outcome of an (async) version check
+        self.version_checked.connect(self._report_version_check)
         # reset the command configuration tab whenever the item selection in
         # tree view changed.
         # This behavior was originally requested in
@@ -167,15 +188,33 @@ class GooeyApp(QObject):
         # but proved to be undesirabled soon after
         # https://github.com/datalad/datalad-gooey/issues/105
         #self._fsbrowser._tree.currentItemChanged.connect(
-        #    lambda cur, prev: self._cmdui.reset_form())
-
-        # TODO could be done lazily to save in entrypoint iteration
+        #    self._cmdui.reset_form)
+
+        # anything that is not needed for the main window to come up is done
+        # once the event loop is running, i.e. after the window is shown
+        QTimer.singleShot(0, self._deferred_init)
+
+    @Slot()
+    def _deferred_init(self):
+        """Complete the setup of secondary UI elements after startup"""
+        # populate now, such that the first opening of the menu is
+        # not delayed
+        self._populate_datalad_menu()
+        # requires an entrypoint iteration, which can be slow
         self._setup_suites()
         self._connect_menu_view(self.get_widget('menuView'))
 
+    @Slot(str, str, MappingProxyType, MappingProxyType)
     def _setup_ongoing_cmdexec(self, thread_id, cmdname, cmdargs, exec_params):
+        # no need to wrap the UI updates below in setUpdatesEnabled(),
+        # Qt merges all pending repaints into one at the next event loop
+        # iteration anyway, and re-enabling updates would force a repaint
+        # of the entire window
         self.get_widget('statusbar').showMessage(f'Started `{cmdname}`')
-        self.main_window.setCursor(QCursor(Qt.BusyCursor))
+        # app-wide busy cursor, but only one across concurrent commands
+        if QApplication.overrideCursor() is None:
+            QApplication.setOverrideCursor(Qt.BusyCursor)
+        self._set_appnap(False)
         # and give a persistent visual indication of what exactly is happening
         # in the log
         if cmdname.startswith('gooey_'):
@@ -186,6 +225,9 @@ class GooeyApp(QObject):
             f"<hr>{render_cmd_call(cmdname, cmdargs)}<hr>"
         )
 
+    # connected to both, execution_finished and execution_failed
+    @Slot(str, str, MappingProxyType, MappingProxyType)
+    @Slot(str, str, MappingProxyType, MappingProxyType, CapturedException)
     def _setup_stopped_cmdexec(
             self, thread_id, cmdname, cmdargs, exec_params, ce=None):
         if ce is None:
@@ -212,34 +254,48 @@ class GooeyApp(QObject):
                     f"<br>{failed_msg}{error_hint}"
                 )
             # but also barf the error into the logviewer
-            lv = self.get_widget('errorLog')
-            lv.appendHtml(failed_msg)
-            lv.appendHtml(
+            # a single append, each one causes a layout update
+            self.get_widget('errorLog').appendHtml(
+                f'{failed_msg}'
                 f'<font color="red"><pre>{ce.format_standard()}</pre></font>'
             )
         if not self._cmdexec.n_running:
-            self.main_window.setCursor(QCursor(Qt.ArrowCursor))
+            if QApplication.overrideCursor() is not None:
+                QApplication.restoreOverrideCursor()
+            self._set_appnap(True)
+
+    def _set_appnap(self, enabled: bool):
+        """Allow or prevent AppNap on macOS, no-op elsewhere"""
+        if self._appnope is None or enabled != self._appnap_disabled:
+            # not supported, or already in the desired state
+            return
+        if enabled:
+            self._appnope.nap()
+        else:
+            self._appnope.nope()
+        self._appnap_disabled = not enabled
 
     def deinit(self):
         dlui.ui.set_backend(self._prev_ui_backend)
+        self._set_appnap(True)
         # restore any possible term prompt setup
         for var, val in self._restore_env.items():
             if val is not None:
                 environ[var] = val
 
-    #@cached_property not available for PY3.7
-    @property
+    @cached_property
     def main_window(self):
-        if not self._main_window:
-            self._main_window = load_ui('main_window')
-        return self._main_window
+        # precompiled from resources/ui/main_window.ui, see Makefile
+        return setup_ui(Ui_MainWindow, QMainWindow())
 
     def get_widget(self, name):
         wgt_cls = GooeyApp._main_window_widgets.get(name)
         if not wgt_cls:
             raise ValueError(f"Unknown widget {name}")
-        wgt = self.main_window.findChild(wgt_cls, name=name)
-        if not wgt:
+        # all named UI elements are attributes of the main window, no need
+        # for a findChild() search
+        wgt = getattr(self.main_window, name, None)
+        if not isinstance(wgt, wgt_cls):
             # if this happens, our internal _widgets is out of sync
             # with the UI declaration
             raise RuntimeError(
@@ -264,10 +320,13 @@ class GooeyApp(QObject):
                 path = action.data()
         if not path:
             # start root path still not given, ask user
-            path = QFileDialog.getExistingDirectory(
-                caption="Select a base directory for DataLad",
-                options=QFileDialog.ShowDirsOnly,
-            )
+            # not using the static getExistingDirectory(), because the native
+            # dialogs of some desktop environments take very long to come up
+            dlg = QFileDialog(caption="Select a base directory for DataLad")
+            dlg.setFileMode(QFileDialog.Directory)
+            dlg.setOption(QFileDialog.ShowDirsOnly, True)
+            dlg.setOption(QFileDialog.DontUseNativeDialog, True)
+            path = dlg.selectedFiles()[0] if dlg.exec() else None
             if not path:
                 # user aborted root path selection, start in HOME.
                 # HOME is a better choice than CWD in most environments
@@ -283,40 +342,56 @@ class GooeyApp(QObject):
         return self._path
 
     def _populate_datalad_menu(self):
-        """Private slot to populate connected QMenus with dataset actions"""
-        sender = self.sender()
-        if sender.objectName() == 'menuDatalad':
-            # stupid workaround, because on a mac an empty menu is hidden, hence cannot
-            # be clicked on. So in the .ui file, we put rubbish in to make it show, which
-            # needs to be cleared now
-            sender.clear()
+        """Populate the main DataLad menu with dataset actions"""
+        menu = self.get_widget('menuDatalad')
+        # stupid workaround, because on a mac an empty menu is hidden, hence cannot
+        # be clicked on. So in the .ui file, we put rubbish in to make it show, which
+        # needs to be cleared now
+        menu.clear()
         from .active_suite import dataset_api
         add_cmd_actions_to_menu(
-            self, self._cmdui.configure, dataset_api, self.sender())
-        # immediately sever the connection to avoid repopulating the menu
-        # over and over
-        self.get_widget('menuDatalad').aboutToShow.disconnect(
-            self._populate_datalad_menu)
+            self, self._cmdui.configure, dataset_api, menu)
 
+    @Slot()
     def _check_new_version(self):
         self.get_widget('statusbar').showMessage(
             'Checking latest version', timeout=2000)
+        # this involves a web request, keep it off the GUI thread
+        QThreadPool.globalInstance().start(self._run_version_check)
+
+    def _run_version_check(self):
+        """The code is executed in a worker thread"""
+        # lazy import, pulls in `requests` and is only needed here
+        from outdated import check_outdated
+        is_outdated, latest = None, ''
         try:
             is_outdated, latest = check_outdated('datalad', dlversion)
         except ValueError:
             # thrown when one is in a development version (ie., more
             # recent than the most recent release)
             is_outdated = False
-            pass
+        except Exception as e:
+            # e.g. no network connection. Must not go unreported, we are
+            # not in the GUI thread
+            ce = CapturedException(e)
+            lgr.debug('Version check failed: %s', ce)
+        self.version_checked.emit(is_outdated, latest)
+
+    @Slot(object, str)
+    def _report_version_check(self, is_outdated, latest):
         mbox = QMessageBox.information
         title = 'Version check'
         msg = 'Your DataLad version is up to date.'
-        if is_outdated:
+        if is_outdated is None:
+            mbox = QMessageBox.warning
+            msg = 'Could not determine the latest DataLad version.'
+        elif is_outdated:
             mbox = QMessageBox.warning
             msg = f'A newer DataLad version {latest} ' \
                   f'is available (installed: {dlversion}).'
         mbox(self.main_window, title, msg)
 
+    @Slot()
     def _get_issue_template(self):
         mbox = QMessageBox.warning
         title = 'Oooops'
@@ -326,6 +401,7 @@ class GooeyApp(QObject):
               'DataLad</a>'
         mbox(self.main_window, title, msg)
 
+    @Slot()
     def _get_help(self):
         mbox = QMessageBox.information
         title = 'I need help!'
@@ -336,6 +412,7 @@ class GooeyApp(QObject):
               'Join us on Matrix </li></ul>'
         mbox(self.main_window, title, msg)
 
+    @Slot()
     def _get_info(self):
         mbox = QMessageBox.information
         title = 'About'
@@ -345,6 +422,7 @@ class GooeyApp(QObject):
               'datalad.org</a>.'
         mbox(self.main_window, title, msg)
 
+    @Slot()
     def _get_diagnostic_info(self):
         self.execute_dataladcmd.emit(
             'wtf',
@@ -392,18 +470,19 @@ class GooeyApp(QObject):
         ):
             mode = dlcfg.obtain(cfgvar)
             submenu = menu.findChild(QMenu, menuname)
+            # a single connection for all actions of the menu
+            submenu.triggered.connect(self._set_mode_cfg)
             for a in submenu.actions():
-                a.triggered.connect(self._set_mode_cfg)
-                a.setData((cfgvar, subject))
-                if a.objectName().split('_')[-1] == mode:
+                # this works for specially crafted actions with names that
+                # have trailing `_<mode-label>` component in their name
+                amode = a.objectName().rsplit('_', 1)[-1]
+                a.setData((cfgvar, subject, amode))
+                if amode == mode:
                     a.setDisabled(True)
 
-    def _set_mode_cfg(self):
-        # this works for specially crafted actions with names that
-        # have trailing `_<mode-label>` component in their name
-        action = self.sender()
-        cfgvar, subject = action.data()
-        mode = action.objectName().split('_')[-1]
+    @Slot(QAction)
+    def _set_mode_cfg(self, action: QAction):
+        cfgvar, subject, mode = action.data()
         assert mode
         dlcfg.set(cfgvar, mode, scope='global')
         QMessageBox.information(
@@ -9,10 +9,12 @@ from queue import Queue
 
 from PySide6.QtCore import (
     QObject,
+    Qt,
     Signal,
     Slot,
 )
 from PySide6.QtWidgets import (
+    QApplication,
     QInputDialog,
     QLineEdit,
     QProgressBar,
@@ -66,22 +68,28 @@ class DataladQtUIBridge(QObject):
 
     @Slot(str)
     def get_answer(self, props: dict):
-        if props.get('choices') is None:
-            # we are asking for a string
-            response, ok = self._get_text_answer(
-                props['title'],
-                props['text'],
-                props.get('default'),
-                props.get('hidden', False),
-            )
-            # TODO implement internal repeat on request
-        else:
-            response, ok = self._get_choice(
-                props['title'],
-                props['text'],
-                props['choices'],
-                props.get('default'),
-            )
+        # questions come from running commands, for which the app shows
+        # a busy cursor. Waiting for user input is not being busy
+        QApplication.setOverrideCursor(Qt.ArrowCursor)
+        try:
+            if props.get('choices') is None:
+                # we are asking for a string
+                response, ok = self._get_text_answer(
+                    props['title'],
+                    props['text'],
+                    props.get('default'),
+                    props.get('hidden', False),
+                )
+                # TODO implement internal repeat on request
+            else:
+                response, ok = self._get_choice(
+                    props['title'],
+                    props['text'],
+                    props['choices'],
+                    props.get('default'),
+                )
+        finally:
+            QApplication.restoreOverrideCursor()
 
         # place in message Q for the asking thread to retrieve
         self.messageq.put((ok, response))
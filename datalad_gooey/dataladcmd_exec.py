@@ -2,9 +2,6 @@ from concurrent.futures import ThreadPoolExecutor
 import threading
 from time import time
 from types import MappingProxyType
-from typing import (
-    Dict,
-)
 
 from PySide6.QtCore import (
     QObject,
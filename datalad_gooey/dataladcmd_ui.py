@@ -18,7 +18,6 @@ from PySide6.QtWidgets import (
 
 from .param_form_utils import populate_form_w_params
 from .api_utils import get_cmd_displayname
-from .active_suite import spec as active_suite
 
 
 class GooeyDataladCmdUI(QObject):
@@ -144,6 +143,8 @@ class GooeyDataladCmdUI(QObject):
         # accessible. Widget empties itself on reconfigure
         self.pwidget.setDisabled(True)
 
+    # also usable as a slot for signals with arguments, they are ignored
+    @Slot()
     def reset_form(self):
         if self._cmd_title:
             self._cmd_title.setText('')
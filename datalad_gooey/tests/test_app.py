@@ -0,0 +1,62 @@
+import threading
+
+import outdated
+from PySide6.QtWidgets import QMessageBox
+
+from datalad.tests.utils_pytest import (
+    assert_equal,
+    assert_in,
+)
+
+
+def test_version_check(gooey_app, monkeypatch, qtbot):
+    shown = []
+    for mbox in ('information', 'warning'):
+        monkeypatch.setattr(
+            QMessageBox, mbox,
+            lambda parent, title, msg, mbox=mbox: shown.append((mbox, msg)))
+
+    check_threads = []
+
+    def check(behavior, threaded=False):
+        def _check_outdated(package, version):
+            check_threads.append(threading.current_thread())
+            if isinstance(behavior, Exception):
+                raise behavior
+            return behavior
+        monkeypatch.setattr(outdated, 'check_outdated', _check_outdated)
+        shown.clear()
+        if threaded:
+            # the real thing: check in a worker thread, report via a
+            # queued signal in the GUI thread
+            with qtbot.waitSignal(gooey_app.version_checked):
+                gooey_app._check_new_version()
+            qtbot.waitUntil(lambda: bool(shown))
+            # the check did not block the GUI thread
+            assert check_threads[-1] is not threading.main_thread()
+        else:
+            # called directly, the report is then delivered synchronously
+            gooey_app._run_version_check()
+        assert_equal(len(shown), 1)
+        return shown[0]
+
+    # no network, or other failure
+    mbox, msg = check(ConnectionError('no network'))
+    assert_equal(mbox, 'warning')
+    assert_equal(msg, 'Could not determine the latest DataLad version.')
+    # development version, newer than latest release
+    mbox, msg = check(ValueError('dev version'))
+    assert_equal(mbox, 'information')
+    assert_equal(msg, 'Your DataLad version is up to date.')
+    # outdated
+    mbox, msg = check((True, 'x'))
+    assert_equal(mbox, 'warning')
+    assert_in('A newer DataLad version x is available', msg)
+    # all of the above, through the worker thread
+    for behavior, expected in (
+            (ConnectionError('no network'), 'Could not determine'),
+            (ValueError('dev version'), 'up to date'),
+            ((True, 'x'), 'A newer DataLad version x'),
+    ):
+        mbox, msg = check(behavior, threaded=True)
+        assert_in(expected, msg)
@@ -13,6 +13,9 @@ def test_qicon_pointer():
     assert hasattr(gooey_resources, '_icons')
     assert 'file' in gooey_resources._icons
     assert isinstance(gooey_resources._icons['file'], QIcon) 
+    # Test whether repeated requests are served from the cache
+    assert gooey_resources.get_best_icon('file') is \
+        gooey_resources._icons['file']
 
 
 def test_gooey_resources():
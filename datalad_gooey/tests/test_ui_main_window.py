@@ -0,0 +1,42 @@
+from pathlib import Path
+import re
+import shutil
+import subprocess
+
+import pytest
+
+import datalad_gooey
+
+
+def _run_uic(uic, *args):
+    return subprocess.run(
+        [uic, *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+def test_compiled_ui_matches_source():
+    # the precompiled main window UI must not go stale when the .ui file
+    # is edited. Regenerate with `make ui`, if this fails
+    uic = shutil.which('pyside6-uic')
+    if uic is None:
+        pytest.skip('pyside6-uic not available')
+    pkg_path = Path(datalad_gooey.__file__).parent
+    committed = (pkg_path / '_ui_main_window.py').read_text()
+    # the output of different uic versions differs, even for the same
+    # .ui file. Only the version that generated the module can tell
+    committed_version = re.search(
+        r'^## Created by: Qt User Interface Compiler version (\S+)$',
+        committed,
+        flags=re.MULTILINE,
+    ).group(1)
+    uic_version = _run_uic(uic, '--version').split()[-1]
+    if uic_version != committed_version:
+        pytest.skip(
+            f'pyside6-uic {uic_version} differs from the version '
+            f'{committed_version} that generated the module')
+    compiled = _run_uic(
+        uic, str(pkg_path / 'resources' / 'ui' / 'main_window.ui'))
+    assert compiled == committed
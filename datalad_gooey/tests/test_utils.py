@@ -0,0 +1,35 @@
+from types import MappingProxyType
+
+from datalad.distribution.dataset import Dataset
+from datalad.tests.utils_pytest import assert_equal
+
+from ..utils import render_cmd_call
+
+
+def test_render_cmd_call(tmp_path):
+    # no dataset
+    assert_equal(
+        render_cmd_call('wtf', {}),
+        "<b>Running:</b> <code>wtf<nobr>()</nobr></code>")
+    # empty or None dataset is the same as no dataset
+    for ds in (None, ''):
+        assert_equal(
+            render_cmd_call('wtf', dict(dataset=ds, sensitive='all')),
+            "<b>Running:</b> "
+            "<code>wtf<nobr>(<i>sensitive</i>='all')</nobr></code>")
+    # dataset as a path string, internal parameters are not shown
+    assert_equal(
+        render_cmd_call('save', MappingProxyType(dict(
+            dataset='/some/ds',
+            path='file',
+            return_type='generator',
+            result_xfm=None,
+        ))),
+        "<b>Running:</b> <code>Dataset('/some/ds')."
+        "save<nobr>(<i>path</i>='file')</nobr></code>")
+    # dataset instance
+    ds = Dataset(tmp_path)
+    assert_equal(
+        render_cmd_call('status', dict(dataset=ds, recursive=True)),
+        f"<b>Running:</b> <code>Dataset({ds.path!r})."
+        "status<nobr>(<i>recursive</i>=True)</nobr></code>")
@@ -1,11 +1,22 @@
-from pathlib import Path
 from typing import Dict
 
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import (
-    QFile,
-    QIODevice,
-)
+try:
+    from functools import cached_property
+except ImportError:
+    # PY3.7
+    class cached_property:
+        """Minimal stand-in for functools.cached_property (PY3.8+)"""
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            val = self.func(instance)
+            instance.__dict__[self.attrname] = val
+            return val
 
 
 class _NoValue:
@@ -18,37 +29,33 @@ class _NoValue:
     pass
 
 
-def load_ui(name, parent=None):
-    ui_file_name = Path(__file__).parent / 'resources' / 'ui' / f"{name}.ui"
-    ui_file = QFile(ui_file_name)
-    if not ui_file.open(QIODevice.ReadOnly):
-        raise RuntimeError(
-            f"Cannot open {ui_file_name}: {ui_file.errorString()}")
-    loader = QUiLoader()
-    ui = loader.load(ui_file, parentWidget=parent)
-    ui_file.close()
-    if not ui:
-        raise RuntimeError(
-            f"Cannot load UI {ui_file_name}: {loader.errorString()}")
-    return ui
+def setup_ui(ui_cls, widget):
+    """Set up a widget from a UI class precompiled with `pyside6-uic`
+
+    This avoids the cost of parsing a .ui file at runtime. Like with
+    `QUiLoader`, all named UI elements are made available as attributes
+    of the returned widget.
+    """
+    ui = ui_cls()
+    ui.setupUi(widget)
+    for name, obj in vars(ui).items():
+        setattr(widget, name, obj)
+    return widget
 
 
 def render_cmd_call(cmdname: str, cmdkwargs: Dict):
     """Minimalistic Python-like rendering of commands for the logs"""
-    cmdkwargs = cmdkwargs.copy()
-    ds_path = cmdkwargs.pop('dataset', None)
+    ds_path = cmdkwargs.get('dataset')
     if ds_path:
         if hasattr(ds_path, 'pathobj'):
             ds_path = ds_path.path
         ds_path = str(ds_path)
     # show commands running on datasets as dataset method calls
-    rendered = "<b>Running:</b> "
-    rendered += f"<code>Dataset({ds_path!r})." if ds_path else ''
-    rendered += f"{cmdname}<nobr>("
-    rendered += ', '.join(
+    ds_call = f"Dataset({ds_path!r})." if ds_path else ''
+    args = ', '.join(
         f"<i>{k}</i>={v!r}"
         for k, v in cmdkwargs.items()
-        if k not in ('return_type', 'result_xfm')
+        if k not in ('dataset', 'return_type', 'result_xfm')
     )
-    rendered += ")</code>"
-    return rendered
+    return f"<b>Running:</b> " \
+        f"<code>{ds_call}{cmdname}<nobr>({args})</nobr></code>"